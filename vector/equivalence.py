@@ -0,0 +1,475 @@
+'''
+Randomized differential harness: every operation is run through the reference Vector3 path
+and through each of the faster paths on the same random inputs, and the paths are compared
+in error (against Vector3) and in throughput.
+
+Each entry of OPERATIONS has:
+    'inputs': a function (count, rng) -> tuple of input columns (lists of tuples)
+    'reference' and every item of 'paths': a (prepare, compute) pair, where prepare turns the
+    input columns into whatever the path works on (Vector3 objects, arrays...) and compute runs
+    the operation. Both are timed, since Vector3 does part of its work when it is built.
+    'tolerance' (optional, DEFAULT_TOLERANCE otherwise): the (absolute, relative) error
+    every path has to stay within, see check.
+
+The inputs mix uniform random values with the edge cases where paths tend to disagree:
+(anti)parallel pairs, vectors on the z axis, tiny and huge magnitudes.
+The lattice_* operations run on integer vectors, which adds an IntVector3 path, and the *_shared
+operations project every vector against the same axis, given to vectorbatch either once or per row.
+
+New fast paths can be compared just by adding them to the 'paths' of an operation.
+'''
+
+import math
+import random
+import re
+import time
+from typing import Callable, Optional
+import numpy as np
+
+import vectorbatch
+from vector3 import Vector3, FloatVector3, IntVector3, Cylindrical, Spherical
+
+
+EDGE_SCALES = {'uniform': 100.0, 'tiny': 1e-3, 'huge': 1e6}
+
+
+def _random_vector(rng: random.Random, kind: str) -> tuple:
+
+    if kind == 'z_axis':
+
+        return (0, 0, rng.choice((-1, 1)) * rng.uniform(1, EDGE_SCALES['uniform']))
+
+    scale = EDGE_SCALES[kind]
+
+    return tuple(rng.uniform(-scale, scale) for _ in range(3))
+
+
+def random_vectors(count: int, rng: random.Random) -> list:
+    '''
+    Random vectors: half of them uniform, the other half on the z axis or with tiny / huge magnitudes.
+    '''
+
+    kinds = ('uniform', 'uniform', 'uniform', 'z_axis', 'tiny', 'huge')
+
+    return [_random_vector(rng, rng.choice(kinds)) for _ in range(count)]
+
+
+def random_pairs(count: int, rng: random.Random) -> tuple:
+    '''
+    Pairs of random vectors where a third of the second vectors are parallel to the first ones
+    and another third anti-parallel, which is where angle is most sensitive to rounding.
+    '''
+
+    first = random_vectors(count, rng)
+    second = []
+
+    for vector in first:
+
+        kind = rng.choice(('independent', 'parallel', 'anti_parallel'))
+
+        if kind == 'independent':
+
+            second.append(random_vectors(1, rng)[0])
+            continue
+
+        factor = rng.uniform(0.1, 10) * (1 if kind == 'parallel' else -1)
+        second.append(tuple(factor * component for component in vector))
+
+    return first, second
+
+
+def random_lattice_vectors(count: int, rng: random.Random, scale: int = 20) -> list:
+    '''
+    Random integer vectors, never the null vector.
+    '''
+
+    vectors = []
+
+    while len(vectors) < count:
+
+        if rng.random() < 0.2:
+
+            vector = (0, 0, rng.randint(-scale, scale))
+
+        else:
+
+            vector = tuple(rng.randint(-scale, scale) for _ in range(3))
+
+        if any(vector):
+
+            vectors.append(vector)
+
+    return vectors
+
+
+def random_cylindrical(count: int, rng: random.Random, scale: float = 100.0) -> list:
+
+    '''
+    Random (r, theta, z) coordinates, a share of them with r == 0 (on the z axis).
+    '''
+
+    return [(rng.choice((0, rng.uniform(0, scale), rng.uniform(0, scale))), rng.uniform(-math.pi, math.pi),
+             rng.uniform(-scale, scale)) for _ in range(count)]
+
+
+def random_spherical(count: int, rng: random.Random, scale: float = 100.0) -> list:
+
+    '''
+    Random (rho, theta, phi) coordinates, a share of them with phi == 0 or pi (on the z axis).
+    '''
+
+    return [(rng.uniform(0, scale), rng.uniform(-math.pi, math.pi),
+             rng.choice((0, math.pi, rng.uniform(0, math.pi), rng.uniform(0, math.pi)))) for _ in range(count)]
+
+
+def radius_value(pretty: str) -> float:
+    '''
+    Reads back the outputs of compact_radius / pretty_sqrt:
+    e.g. radius_value('3 sqrt(2)') == 3 * sqrt(2)
+    '''
+
+    match = re.fullmatch(r'(?:(\S+) )?sqrt\((\S+)\)', pretty)
+
+    if match is None:
+
+        return float(pretty)
+
+    outside, inside = match.groups()
+
+    return float(outside or 1) * math.sqrt(float(inside))
+
+
+def _identity(*columns: list) -> tuple:
+
+    return columns
+
+
+def _vector3s(*columns: list) -> tuple:
+
+    return tuple([Vector3(*vector) for vector in column] for column in columns)
+
+
+def _float_vector3s(*columns: list) -> tuple:
+
+    return tuple([FloatVector3(*vector) for vector in column] for column in columns)
+
+
+def _int_vector3s(*columns: list) -> tuple:
+
+    return tuple([IntVector3(*vector) for vector in column] for column in columns)
+
+
+def _arrays(*columns: list) -> tuple:
+
+    return tuple(vectorbatch.as_vectors(column) for column in columns)
+
+
+def _shared_axis_arrays(vectors: list, axes: list) -> tuple:
+    '''
+    The axis column repeats a single axis: the batch path gets it once, as a single vector.
+    '''
+
+    return vectorbatch.as_vectors(vectors), vectorbatch.as_vectors(axes[0])
+
+
+def _each_dot(a: list, b: list) -> list:
+
+    return [u.dot(v) for u, v in zip(a, b)]
+
+
+def _each_cross(a: list, b: list) -> list:
+
+    return [u.cross(v).values for u, v in zip(a, b)]
+
+
+def _each_normalize(a: list) -> list:
+
+    return [u.normalize().values for u in a]
+
+
+def _each_angle(a: list, b: list) -> list:
+
+    return [u.angle(v) for u, v in zip(a, b)]
+
+
+def _each_component_along(a: list, b: list) -> list:
+
+    return [u.component_along(v) for u, v in zip(a, b)]
+
+
+def _each_project_onto(a: list, b: list) -> list:
+
+    return [u.project_onto(v).values for u, v in zip(a, b)]
+
+
+def _each_reject_from(a: list, b: list) -> list:
+
+    return [u.reject_from(v).values for u, v in zip(a, b)]
+
+
+def _each_reflect(a: list, b: list) -> list:
+
+    return [u.reflect(v).values for u, v in zip(a, b)]
+
+
+def _each_to_cylindrical(a: list) -> list:
+
+    return [(u.r, u.theta, u.z) for u in a]
+
+
+def _each_to_spherical(a: list) -> list:
+
+    return [(u.rho, u.theta, u.phi) for u in a]
+
+
+def _each_from_cylindrical(coordinates: list) -> list:
+
+    return [Cylindrical(*coordinate).values for coordinate in coordinates]
+
+
+def _each_from_spherical(coordinates: list) -> list:
+
+    return [Spherical(*coordinate).values for coordinate in coordinates]
+
+
+def _each_compact_radius(a: list) -> list:
+
+    radii = (u.compact_radius() for u in a)
+
+    return [(radius_value(radius['r']), radius_value(radius['rho'])) for radius in radii]
+
+
+def _each_radius(a: list) -> list:
+
+    return [(u.r, u.rho) for u in a]
+
+
+def _batch_radius(a: np.ndarray) -> np.ndarray:
+
+    return np.column_stack((vectorbatch.to_cylindrical(a)[:, 0], vectorbatch.norm(a)))
+
+
+def _singles(count: int, rng: random.Random) -> tuple:
+
+    return (random_vectors(count, rng),)
+
+
+def _lattice_pairs(count: int, rng: random.Random) -> tuple:
+
+    return random_lattice_vectors(count, rng), random_lattice_vectors(count, rng)
+
+
+def _shared_axis(count: int, rng: random.Random) -> tuple:
+
+    return random_vectors(count, rng), random_vectors(1, rng) * count
+
+
+def _projection(each: Callable, batch: Callable, inputs: Callable = random_pairs) -> dict:
+    '''
+    Projection-like operations compare the same paths, see OPERATIONS.
+    '''
+
+    paths = {'FloatVector3': (_float_vector3s, each), 'vectorbatch': (_arrays, batch)}
+
+    if inputs is _shared_axis:
+
+        paths['vectorbatch (shared)'] = (_shared_axis_arrays, batch)
+
+    return {'inputs': inputs, 'reference': (_vector3s, each), 'paths': paths}
+
+
+def _lattice(each: Callable, batch: Callable, **options) -> dict:
+    '''
+    Operations on integer vectors, which IntVector3 can run as well.
+    '''
+
+    paths = {'IntVector3': (_int_vector3s, each), 'FloatVector3': (_float_vector3s, each), 'vectorbatch': (_arrays, batch)}
+
+    return {'inputs': _lattice_pairs, 'reference': (_vector3s, each), 'paths': paths, **options}
+
+
+# (absolute, relative) tolerance. closestnum snaps anything within 1e-9 of an integer, and closestfloat
+# cuts the digits after six 0's or 9's (e.g. 1.0000008913 becomes 1.0), so the reference itself
+# can be up to 1e-9 away from a plain float result, or ~1e-6 relative.
+DEFAULT_TOLERANCE = (1e-8, 1e-6)
+
+# acos is steep near (anti)parallel vectors, a 1e-16 error in the cosine becomes ~1e-8 in the angle.
+ANGLE_TOLERANCE = (1e-7, 1e-6)
+
+OPERATIONS = {
+    'dot': {
+        'inputs': random_pairs,
+        'reference': (_vector3s, _each_dot),
+        'paths': {'FloatVector3': (_float_vector3s, _each_dot), 'vectorbatch': (_arrays, vectorbatch.dot)},
+    },
+    'cross': {
+        'inputs': random_pairs,
+        'reference': (_vector3s, _each_cross),
+        'paths': {'FloatVector3': (_float_vector3s, _each_cross), 'vectorbatch': (_arrays, vectorbatch.cross)},
+    },
+    'normalize': {
+        'inputs': _singles,
+        'reference': (_vector3s, _each_normalize),
+        'paths': {'FloatVector3': (_float_vector3s, _each_normalize), 'vectorbatch': (_arrays, vectorbatch.normalize)},
+    },
+    'angle': {
+        'inputs': random_pairs,
+        'reference': (_vector3s, _each_angle),
+        'tolerance': ANGLE_TOLERANCE,
+        'paths': {'FloatVector3': (_float_vector3s, _each_angle), 'vectorbatch': (_arrays, vectorbatch.angle)},
+    },
+    'to_cylindrical': {
+        'inputs': _singles,
+        'reference': (_vector3s, _each_to_cylindrical),
+        'paths': {'FloatVector3': (_float_vector3s, _each_to_cylindrical),
+                  'vectorbatch': (_arrays, vectorbatch.to_cylindrical)},
+    },
+    'to_spherical': {
+        'inputs': _singles,
+        'reference': (_vector3s, _each_to_spherical),
+        'paths': {'FloatVector3': (_float_vector3s, _each_to_spherical),
+                  'vectorbatch': (_arrays, vectorbatch.to_spherical)},
+    },
+    'from_cylindrical': {
+        'inputs': lambda count, rng: (random_cylindrical(count, rng),),
+        'reference': (_identity, _each_from_cylindrical),
+        'paths': {'vectorbatch': (_arrays, vectorbatch.from_cylindrical)},
+    },
+    'from_spherical': {
+        'inputs': lambda count, rng: (random_spherical(count, rng),),
+        'reference': (_identity, _each_from_spherical),
+        'paths': {'vectorbatch': (_arrays, vectorbatch.from_spherical)},
+    },
+    'compact_radius': {
+        'inputs': lambda count, rng: (random_lattice_vectors(count, rng),),
+        'reference': (_vector3s, _each_compact_radius),
+        'paths': {'IntVector3': (_int_vector3s, _each_radius), 'FloatVector3': (_float_vector3s, _each_radius),
+                  'vectorbatch': (_arrays, _batch_radius)},
+    },
+    'component_along': _projection(_each_component_along, vectorbatch.component_along),
+    'project_onto': _projection(_each_project_onto, vectorbatch.project_onto),
+    'reject_from': _projection(_each_reject_from, vectorbatch.reject_from),
+    'reflect': _projection(_each_reflect, vectorbatch.reflect),
+    'project_onto_shared': _projection(_each_project_onto, vectorbatch.project_onto, _shared_axis),
+    'reflect_shared': _projection(_each_reflect, vectorbatch.reflect, _shared_axis),
+    'lattice_dot': _lattice(_each_dot, vectorbatch.dot),
+    'lattice_cross': _lattice(_each_cross, vectorbatch.cross),
+    'lattice_angle': _lattice(_each_angle, vectorbatch.angle, tolerance=ANGLE_TOLERANCE),
+    'lattice_reflect': _lattice(_each_reflect, vectorbatch.reflect),
+}
+
+
+def _timed(path: tuple, inputs: tuple) -> tuple:
+    '''
+    Runs a (prepare, compute) pair; returns the results as a float array and the throughput (vectors / s).
+    '''
+
+    prepare, compute = path
+
+    start = time.perf_counter()
+    results = compute(*prepare(*inputs))
+    elapsed = time.perf_counter() - start
+
+    return np.asarray(results, dtype=float), len(inputs[0]) / max(elapsed, 1e-12)
+
+
+def errors(reference: np.ndarray, results: np.ndarray, tolerance: tuple = DEFAULT_TOLERANCE) -> dict:
+    '''
+    Maximum absolute and relative error of results against the reference, and the number of values
+    out of tolerance, i.e. over both the absolute and the relative tolerance (like math.isclose).
+    The relative error leaves out the values where the reference is exactly 0:
+    only the absolute tolerance applies to them.
+    '''
+
+    absolute_tolerance, relative_tolerance = tolerance
+
+    absolute = np.abs(results - reference)
+    magnitude = np.abs(reference)
+
+    relative = np.divide(absolute, magnitude, out=np.zeros_like(absolute), where=magnitude != 0)
+    over_relative = np.where(magnitude != 0, relative > relative_tolerance, True)
+
+    # nan (a path failing where the reference doesn't, or the other way around) is always out of tolerance.
+    out_of_tolerance = ((absolute > absolute_tolerance) & over_relative) | np.isnan(absolute)
+
+    return {'max_abs_error': float(np.max(absolute, initial=0)), 'max_rel_error': float(np.max(relative, initial=0)),
+            'out_of_tolerance': int(np.count_nonzero(out_of_tolerance))}
+
+
+def run(count: int = 10000, seed: int = 0, operations: Optional[list] = None) -> dict:
+    '''
+    Runs every operation (or the given subset) on count random inputs through every path.
+
+    Returns a dict {operation: {path: stats}}, where the stats of the reference Vector3 path
+    are its throughput, and the stats of every other path are its errors against the
+    reference, the number of values out of tolerance, its throughput and its speedup over the reference.
+    '''
+
+    rng = random.Random(seed)
+    report = {}
+
+    for name in operations or OPERATIONS:
+
+        operation = OPERATIONS[name]
+        inputs = operation['inputs'](count, rng)
+        tolerance = operation.get('tolerance', DEFAULT_TOLERANCE)
+
+        reference, reference_throughput = _timed(operation['reference'], inputs)
+        report[name] = {'Vector3': {'throughput': reference_throughput}}
+
+        for path_name, path in operation['paths'].items():
+
+            results, throughput = _timed(path, inputs)
+
+            stats = errors(reference, results, tolerance)
+            stats['throughput'] = throughput
+            stats['speedup'] = throughput / reference_throughput
+
+            report[name][path_name] = stats
+
+    return report
+
+
+def check(count: int = 1000, seed: int = 0, operations: Optional[list] = None) -> dict:
+    '''
+    Same as run, but raises an AssertionError listing every operation and path
+    that went out of tolerance. Returns the report otherwise.
+    '''
+
+    report = run(count, seed, operations)
+
+    failures = [f'{name} / {path_name}: {stats["out_of_tolerance"]} values out of tolerance '
+                f'(max abs error {stats["max_abs_error"]:.3e}, max rel error {stats["max_rel_error"]:.3e})'
+                for name, paths in report.items() for path_name, stats in paths.items()
+                if stats.get('out_of_tolerance')]
+
+    if failures:
+
+        raise AssertionError('\n'.join(failures))
+
+    return report
+
+
+def format_report(report: dict) -> str:
+
+    lines = [f'{"operation":<22}{"path":<22}{"max abs err":>14}{"max rel err":>14}{"out of tol":>12}'
+             f'{"vectors/s":>14}{"speedup":>10}']
+
+    for name, paths in report.items():
+
+        for path_name, stats in paths.items():
+
+            if path_name == 'Vector3':
+
+                lines.append(f'{name:<22}{path_name:<22}{"":>14}{"":>14}{"":>12}{stats["throughput"]:>14.0f}{"":>10}')
+                continue
+
+            lines.append(f'{"":<22}{path_name:<22}{stats["max_abs_error"]:>14.3e}{stats["max_rel_error"]:>14.3e}'
+                         f'{stats["out_of_tolerance"]:>12}{stats["throughput"]:>14.0f}{stats["speedup"]:>9.1f}x')
+
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+
+    print(format_report(run()))
@@ -0,0 +1,128 @@
+from typing import Union
+import numpy as np
+
+from vectorbatch import VectorLike, as_vectors, snap, _dot, _cross, _unit
+
+Faces = Union[list, tuple, np.ndarray]
+
+
+def as_faces(faces: Faces, vertex_count: int) -> np.ndarray:
+    '''
+    Turns the faces into an (m, 3) array of vertex indices.
+
+    Indices have to be integers (a float index would otherwise be silently truncated)
+    within [0, vertex_count) (a negative one would otherwise silently wrap around):
+    a TypeError / IndexError is raised if they aren't.
+    '''
+
+    faces = np.asarray(faces)
+
+    if faces.size == 0:
+
+        return np.zeros((0, 3), dtype=np.intp)
+
+    if not np.issubdtype(faces.dtype, np.integer):
+
+        raise TypeError(f'face indices must be integers, got {faces.dtype}')
+
+    faces = faces.reshape(-1, 3)
+
+    if faces.min() < 0 or faces.max() >= vertex_count:
+
+        raise IndexError(f'face indices must be within [0, {vertex_count}), got [{faces.min()}, {faces.max()}]')
+
+    return faces
+
+
+def _corners(vertices: VectorLike, faces: Faces) -> tuple:
+
+    vertices = as_vectors(vertices)
+    faces = as_faces(faces, len(vertices))
+
+    return vertices, faces, vertices[faces[:, 0]], vertices[faces[:, 1]], vertices[faces[:, 2]]
+
+
+def _face_cross(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    '''
+    (b - a) x (c - a) for every face: its direction is the face normal
+    and its norm is twice the face area.
+    '''
+
+    return _cross(b - a, c - a)
+
+
+def face_geometry(vertices: VectorLike, faces: Faces) -> dict:
+    '''
+    Computes the unit normal and the area of every triangle in a single pass.
+
+    vertices is an (n, 3) array of points and faces an (m, 3) array of indices into it.
+    The normal of the face (a, b, c) follows the right hand rule, the same as
+    ((b - a) ** (c - a)).normalize() with Vector3 objects.
+    Degenerate faces have a null normal and an area of 0.
+    '''
+
+    _, _, a, b, c = _corners(vertices, faces)
+
+    crossed = _face_cross(a, b, c)
+    doubled_areas = np.sqrt(_dot(crossed, crossed))
+
+    normals = _unit(crossed, doubled_areas)
+
+    return {'normals': snap(normals), 'areas': snap(doubled_areas / 2)}
+
+
+def face_normals(vertices: VectorLike, faces: Faces) -> np.ndarray:
+    '''
+    Returns the unit normal of every triangle, see face_geometry.
+    '''
+
+    return face_geometry(vertices, faces)['normals']
+
+
+def face_areas(vertices: VectorLike, faces: Faces) -> np.ndarray:
+    '''
+    Returns the area of every triangle, see face_geometry.
+    '''
+
+    return face_geometry(vertices, faces)['areas']
+
+
+def vertex_normals(vertices: VectorLike, faces: Faces) -> np.ndarray:
+    '''
+    Returns the area weighted normal of every vertex: the sum of the normals of the faces
+    sharing the vertex, each one weighted by the area of its face, normalized.
+
+    The unnormalized face cross product already has a norm of twice the face area,
+    so it is summed as is. Vertices that don't belong to any face get a null normal.
+    '''
+
+    vertices, faces, a, b, c = _corners(vertices, faces)
+
+    crossed = _face_cross(a, b, c)
+    summed = np.zeros_like(vertices)
+
+    for corner in range(3):
+
+        np.add.at(summed, faces[:, corner], crossed)
+
+    return snap(_unit(summed, np.sqrt(_dot(summed, summed))))
+
+
+def signed_volumes(vertices: VectorLike, faces: Faces) -> np.ndarray:
+    '''
+    Returns the signed volume of the tetrahedron formed by the origin and every triangle,
+    i.e. a • (b x c) / 6. Faces wound counterclockwise (seen from outside) give positive volumes.
+    '''
+
+    _, _, a, b, c = _corners(vertices, faces)
+
+    return snap(_dot(a, _cross(b, c)) / 6)
+
+
+def mesh_volume(vertices: VectorLike, faces: Faces) -> float:
+    '''
+    Returns the volume enclosed by a closed, consistently wound mesh,
+    i.e. the sum of its signed volumes.
+    '''
+
+    return float(snap(np.sum(signed_volumes(vertices, faces))))
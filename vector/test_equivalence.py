@@ -0,0 +1,9 @@
+import pytest
+
+from equivalence import check
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_fast_paths_agree_with_vector3(seed):
+
+    check(count=2000, seed=seed)
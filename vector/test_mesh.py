@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from mesh import face_geometry, face_normals, face_areas, vertex_normals, signed_volumes, mesh_volume
+from vector3 import Vector3
+
+# Unit cube, vertex i is at (i & 1, i >> 1 & 1, i >> 2 & 1), faces wound counterclockwise seen from outside.
+CUBE_VERTICES = [[i & 1, i >> 1 & 1, i >> 2 & 1] for i in range(8)]
+CUBE_FACES = [
+    [0, 2, 3], [0, 3, 1],
+    [4, 5, 7], [4, 7, 6],
+    [0, 1, 5], [0, 5, 4],
+    [2, 6, 7], [2, 7, 3],
+    [0, 4, 6], [0, 6, 2],
+    [1, 3, 7], [1, 7, 5],
+]
+
+TETRAHEDRON_VERTICES = [[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1]]
+TETRAHEDRON_FACES = [[0, 2, 1], [0, 1, 3], [0, 3, 2], [1, 2, 3]]
+
+
+def test_closed_cube():
+
+    geometry = face_geometry(CUBE_VERTICES, CUBE_FACES)
+
+    assert np.array_equal(geometry['areas'], np.full(12, 0.5))
+    assert mesh_volume(CUBE_VERTICES, CUBE_FACES) == 1
+
+    # Every normal points away from the center of the cube.
+    vertices = np.array(CUBE_VERTICES, dtype=float)
+    centroids = vertices[np.array(CUBE_FACES)].mean(axis=1)
+
+    assert np.all(np.einsum('ij,ij->i', geometry['normals'], centroids - 0.5) > 0)
+    assert np.array_equal(np.abs(geometry['normals']).sum(axis=1), np.ones(12))
+
+
+def test_tetrahedron():
+
+    assert np.allclose(signed_volumes(TETRAHEDRON_VERTICES, TETRAHEDRON_FACES), [0, 0, 0, 1 / 6])
+    assert np.array_equal(vertex_normals(TETRAHEDRON_VERTICES, TETRAHEDRON_FACES)[1:], np.eye(3))
+
+
+def test_matches_vector3():
+
+    rng = np.random.default_rng(0)
+    vertices = rng.uniform(-10, 10, (30, 3))
+    faces = rng.integers(0, 30, (20, 3))
+
+    normals = face_normals(vertices, faces)
+
+    for face, normal in zip(faces, normals):
+
+        a, b, c = (Vector3(*vertices[index]) for index in face)
+
+        assert np.allclose(normal, ((b - a) ** (c - a)).normalize().values)
+        assert np.isclose(face_areas(vertices, [face])[0], ((b - a) ** (c - a)).norm / 2)
+
+
+def test_degenerate_face():
+
+    vertices = [[0, 0, 0], [1, 1, 1], [2, 2, 2], [0, 1, 0]]
+    geometry = face_geometry(vertices, [[0, 1, 2], [0, 0, 3]])
+
+    assert np.array_equal(geometry['normals'], np.zeros((2, 3)))
+    assert np.array_equal(geometry['areas'], [0, 0])
+    assert np.array_equal(vertex_normals(vertices, [[0, 1, 2]]), np.zeros((4, 3)))
+
+
+def test_vertices_outside_every_face_get_null_normals():
+
+    normals = vertex_normals(TETRAHEDRON_VERTICES + [[5, 5, 5]], TETRAHEDRON_FACES)
+
+    assert np.array_equal(normals[4], [0, 0, 0])
+
+
+def test_invalid_faces():
+
+    with pytest.raises(TypeError):
+
+        face_normals(TETRAHEDRON_VERTICES, [[0.7, 1, 2]])
+
+    with pytest.raises(IndexError):
+
+        face_normals(TETRAHEDRON_VERTICES, [[-1, 1, 2]])
+
+    with pytest.raises(IndexError):
+
+        face_normals(TETRAHEDRON_VERTICES, [[0, 1, 4]])
+
+
+def test_no_faces():
+
+    assert face_normals(TETRAHEDRON_VERTICES, []).shape == (0, 3)
+    assert mesh_volume(TETRAHEDRON_VERTICES, []) == 0
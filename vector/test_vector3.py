@@ -0,0 +1,231 @@
+import math
+import pytest
+
+from vector3 import Vector3, FloatVector3, IntVector3
+
+
+def test_null_vector():
+
+    null = Vector3()
+
+    assert null.values == (0, 0, 0)
+    assert (null.r, null.rho, null.theta, null.phi) == (0, 0, 0, 0)
+    assert null.norm == 0
+    assert null.component_output() == 'null vector'
+
+
+def test_operations_giving_the_null_vector():
+
+    assert Vector3(1, 2, 3) ** Vector3(2, 4, 6) == Vector3(0, 0, 0)
+    assert Vector3(1, 2, 3) - Vector3(1, 2, 3) == Vector3()
+    assert Vector3(1, 2, 3) * 0 == Vector3()
+
+
+def test_angle_between_anti_parallel_vectors():
+
+    # The rounded dot product and norms give a cosine of -1.0000000000000002 here.
+    a = Vector3(3.428, -8.719, 5.165)
+    b = a * -5.95
+
+    assert a.angle(b) == math.pi
+    assert a.angle(b, degree=True) == 180
+
+
+def test_angle_between_tiny_vectors():
+
+    # Their dot product is ~1e-9, which closestnum used to snap to 0 (i.e. a right angle).
+    a = Vector3(0.0006890133004142603, -0.0007129137766660122, 0.0009495154322162476)
+    b = Vector3(0.0003343629079163356, -0.0004070271440768338, -0.0005473956754621762)
+
+    assert a.angle(b) == pytest.approx(1.5700339132765013, abs=1e-12)
+
+
+def test_phi_when_rho_is_snapped():
+
+    # closestfloat snaps rho to 46, a bit less than |z|.
+    v = Vector3(0, 0, -46.00000084154761)
+
+    assert v.rho == 46
+    assert v.phi == math.pi
+
+
+def test_angle_between_parallel_vectors():
+
+    assert Vector3(1, 2, 3).angle(Vector3(2, 4, 6)) == 0
+    assert Vector3(1, 0, 0).angle(Vector3(0, 1, 0), pretty_print=True) == '1/2 pi rad'
+
+
+def test_projection_onto_orthogonal_axis():
+
+    v = Vector3(1, 0, 0)
+
+    assert v.project_onto([0, 1, 0]) == Vector3()
+    assert v.reject_from([0, 1, 0]) == v
+    assert v.component_along(Vector3(0, 3, 0)) == 0
+    assert v.reflect(Vector3(0, 2, 0)) == v
+
+
+def test_projection_onto_parallel_axis():
+
+    v = Vector3(0, 5, 0)
+
+    assert v.project_onto([0, 1, 0]) == v
+    assert v.reject_from([0, 1, 0]) == Vector3()
+    assert v.component_along([0, -2, 0]) == -5
+    assert v.reflect([0, 1, 0]) == Vector3(0, -5, 0)
+
+
+def test_projection_in_general_position():
+
+    v = Vector3(3, 4, 5)
+
+    assert v.project_onto(Vector3(0, 2, 0)) == Vector3(0, 4, 0)
+    assert v.reject_from((0, 2, 0)) == Vector3(3, 0, 5)
+    assert v.project_onto_plane([0, 0, 1]) == Vector3(3, 4, 0)
+    assert v.project_onto([1, 1, 0]) + v.reject_from([1, 1, 0]) == v
+    assert Vector3(1, -1, 0).reflect([0, 1, 0]) == Vector3(1, 1, 0)
+
+
+def test_projection_onto_null_axis():
+
+    v = Vector3(1, 2, 3)
+
+    for method in (v.component_along, v.project_onto, v.reject_from, v.project_onto_plane, v.reflect):
+
+        with pytest.raises(ZeroDivisionError):
+
+            method(Vector3())
+
+
+def test_int_vectors_stay_on_the_lattice():
+
+    a, b = IntVector3(1, 2, 3), IntVector3(4, 5, 6)
+
+    for result in (a + b, a - b, a ** b, a * 2, 3 * a, a + [1, 1, 1], [1, 1, 1] - a):
+
+        assert type(result) is IntVector3
+
+    assert a * b == 32 and type(a * b) is int
+    assert a.norm_squared == 14 and type(a.norm_squared) is int
+    assert [1, 1, 1] - a == IntVector3(0, -1, -2)
+    assert (1, 1, 1) ** a == IntVector3(1, -2, 1)
+
+
+def test_mixing_floats_gives_float_vectors():
+
+    a, f = IntVector3(1, 2, 3), FloatVector3(0.5, 0, 0)
+
+    for result in (a + f, f + a, a - f, a * 0.5, 0.5 * a, a / 1, a + [0.5, 0, 0], [0.5, 0, 0] - a, a.normalize()):
+
+        assert type(result) is FloatVector3
+
+    assert [0.5, 0, 0] - a == FloatVector3(-0.5, -2, -3)
+    # No closestnum snapping on the way.
+    assert (FloatVector3(0.1, 0, 0) + [0.2, 0, 0]).x == 0.1 + 0.2
+
+
+def test_int_vectors_reject_non_integers():
+
+    with pytest.raises(TypeError):
+
+        IntVector3(1, 2.5, 3)
+
+    with pytest.raises(TypeError):
+
+        IntVector3(1.0, 0, 0)
+
+
+def test_subclasses_of_specialized_vectors():
+
+    class MyVector(FloatVector3):
+
+        pass
+
+    class MyIntVector(IntVector3):
+
+        pass
+
+    assert MyVector(1, 2, 3) + [1, 2, 3] == FloatVector3(2, 4, 6)
+    assert (MyVector(0.1, 0, 0) + MyVector(0.2, 0, 0)).x == 0.1 + 0.2
+    assert type(MyVector(1, 0, 0) * 2) is FloatVector3
+    assert type(MyIntVector(1, 2, 3) + IntVector3(1, 1, 1)) is IntVector3
+    assert type(MyIntVector(1, 2, 3) + MyVector(1, 1, 1)) is FloatVector3
+    assert MyVector(3, 4, 0) > MyIntVector(0, 0, 4)
+
+
+def test_specialized_projections_keep_their_type():
+
+    a, axis = IntVector3(3, 4, 5), IntVector3(0, 2, 0)
+
+    for result in (a.project_onto(axis), a.reject_from(axis), a.project_onto_plane(axis), a.reflect(axis)):
+
+        assert type(result) is FloatVector3
+
+    assert a.project_onto(axis) == FloatVector3(0, 4, 0)
+    assert a.reject_from([0, 2, 0]) == FloatVector3(3, 0, 5)
+    assert a.reflect((0, 1, 0)) == FloatVector3(3, -4, 5)
+    assert a.component_along(axis) == 4.0
+
+    # No closestnum snapping, unlike Vector3.
+    assert FloatVector3(0.1, 0.2, 0).project_onto([1, 0, 0]).x == 0.1
+
+    with pytest.raises(ZeroDivisionError):
+
+        a.project_onto(IntVector3())
+
+
+def test_specialized_comparisons():
+
+    a, b, f = IntVector3(3, 4, 0), IntVector3(0, 0, 5), FloatVector3(1, 1, 1)
+
+    assert a >= b and a <= b and not a > b
+    assert f < a and a > f
+    assert a > 4.9 and a < 5.1
+    assert a >= [5, 0, 0] and a < (5, 0, 1)
+
+
+def test_norm_caches_are_seeded_and_reused(monkeypatch):
+
+    v = Vector3(3, 4, 0)
+
+    # __init__ already knows rho, so the norm is never computed again.
+    monkeypatch.setattr(Vector3, '_compute_norm', lambda self: pytest.fail('norm computed again'))
+
+    assert v.norm == 5
+    assert v.norm_squared == 25
+    assert v.normalize() == Vector3(0.6, 0.8, 0)
+
+    monkeypatch.setattr(Vector3, '_compute_norm_squared', lambda self: pytest.fail('norm_squared computed again'))
+    monkeypatch.setattr(Vector3, '_compute_unit', lambda self: pytest.fail('unit computed again'))
+
+    assert v.norm_squared == 25
+    assert v.normalize() == Vector3(0.6, 0.8, 0)
+
+
+def test_replacing_values_refreshes_the_caches():
+
+    v = Vector3(3, 4, 0)
+
+    assert v.norm == 5 and v.normalize() == Vector3(0.6, 0.8, 0)
+
+    v.values = (0, 0, 2)
+
+    assert v.norm == 2
+    assert v.norm_squared == 4
+    assert v.normalize() == Vector3(0, 0, 1)
+
+
+def test_normalize_returns_a_new_vector_every_time():
+
+    for v in (Vector3(3, 4, 0), FloatVector3(3, 4, 0)):
+
+        first = v.normalize()
+        first.values = (1, 0, 0)
+        first.x = 1
+
+        second = v.normalize()
+
+        assert second is not first
+        assert second.values == (0.6, 0.8, 0)
+        assert type(second) is type(first)
+        assert v.unit == second
@@ -0,0 +1,186 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from vectorasync import map_batches, map_vectors, micro_batches
+
+
+async def from_list(items: list, delay: float = 0):
+
+    for item in items:
+
+        if delay:
+
+            await asyncio.sleep(delay)
+
+        yield item
+
+
+async def collect(iterator) -> list:
+
+    return [item async for item in iterator]
+
+
+def test_results_keep_the_source_order():
+
+    def slow_for_small(x):
+
+        # Later batches finish first.
+        time.sleep(0.001 * (20 - x))
+
+        return x * x
+
+    with ThreadPoolExecutor(4) as executor:
+
+        results = asyncio.run(collect(map_vectors(slow_for_small, from_list(range(20)), batch_size=3, executor=executor)))
+
+    assert results == [x * x for x in range(20)]
+
+
+def test_micro_batches_flush_on_the_latency_deadline():
+
+    async def trickle():
+
+        yield 1
+        await asyncio.sleep(0.5)
+        yield 2
+
+    async def first_batch():
+
+        batches = micro_batches(trickle(), batch_size=256, max_latency=0.01)
+        start = time.perf_counter()
+        batch = await batches.__anext__()
+        elapsed = time.perf_counter() - start
+        await batches.aclose()
+
+        return batch, elapsed
+
+    batch, elapsed = asyncio.run(first_batch())
+
+    assert batch == [1]
+    assert elapsed < 0.25
+
+
+def test_micro_batches_split_full_batches():
+
+    batches = asyncio.run(collect(micro_batches(from_list(range(7)), batch_size=3)))
+
+    assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_backpressure_bounds_the_submitted_batches():
+
+    submitted = []
+    lock = threading.Lock()
+
+    def record(batch):
+
+        with lock:
+
+            submitted.append(batch)
+
+        return batch
+
+    async def consume_slowly():
+
+        results = map_batches(record, from_list([[i] for i in range(20)]), max_pending=4)
+        first = await results.__anext__()
+
+        # The consumer stalls: the other slots fill up, and nothing more is submitted.
+        await asyncio.sleep(0.2)
+        stalled = len(submitted)
+
+        rest = await collect(results)
+
+        return first, stalled, rest
+
+    with ThreadPoolExecutor(8) as executor:
+
+        first, stalled, rest = asyncio.run(consume_slowly())
+
+    assert first == [0]
+    assert stalled == 4
+    assert [first] + rest == [[i] for i in range(20)]
+
+
+def test_errors_from_the_source():
+
+    async def broken():
+
+        yield 1
+        yield 2
+        raise ValueError('source failed')
+
+    async def run():
+
+        results = []
+
+        with pytest.raises(ValueError, match='source failed'):
+
+            async for result in map_vectors(lambda x: x + 1, broken(), batch_size=1):
+
+                results.append(result)
+
+        return results
+
+    assert asyncio.run(run()) == [2, 3]
+
+
+def test_errors_from_func():
+
+    def fail_on_three(x):
+
+        if x == 3:
+
+            raise ZeroDivisionError('three')
+
+        return x
+
+    async def run():
+
+        with pytest.raises(ZeroDivisionError, match='three'):
+
+            await collect(map_vectors(fail_on_three, from_list(range(10)), batch_size=2))
+
+    asyncio.run(run())
+
+
+def test_early_aclose_cleans_up():
+
+    closed = []
+
+    async def endless():
+
+        try:
+
+            i = 0
+
+            while True:
+
+                yield i
+                i += 1
+                await asyncio.sleep(0)
+
+        finally:
+
+            closed.append(True)
+
+    async def run():
+
+        results = map_vectors(lambda x: x, endless(), batch_size=4)
+        first = await results.__anext__()
+        await results.aclose()
+
+        # Give cancelled tasks a chance to finish.
+        await asyncio.sleep(0.01)
+
+        return first, [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+    first, leftover_tasks = asyncio.run(run())
+
+    assert first == 0
+    assert closed == [True]
+    assert leftover_tasks == []
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+import vectorbatch
+from vector3 import Vector3
+
+
+def test_as_vectors():
+
+    assert np.array_equal(vectorbatch.as_vectors([1, 2]), [[1, 2, 0]])
+    assert np.array_equal(vectorbatch.as_vectors(Vector3(1, 2, 3)), [[1, 2, 3]])
+    assert np.array_equal(vectorbatch.as_vectors([Vector3(1, 2, 3), (4, 5, 6)]), [[1, 2, 3], [4, 5, 6]])
+
+
+def test_empty_batch():
+
+    assert vectorbatch.as_vectors([]).shape == (0, 3)
+    assert vectorbatch.normalize([]).shape == (0, 3)
+    assert vectorbatch.dot([], [1, 2, 3]).shape == (0,)
+
+
+def test_too_many_components():
+
+    with pytest.raises(ValueError):
+
+        vectorbatch.as_vectors([[1, 2, 3, 4]])
+
+
+def test_matches_vector3():
+
+    a, b = Vector3(1, 2, 3), Vector3(-4, 5, 0.5)
+
+    assert vectorbatch.dot(a, b)[0] == a.dot(b)
+    assert np.array_equal(vectorbatch.cross(a, b)[0], a.cross(b).values)
+    assert np.allclose(vectorbatch.normalize(a)[0], a.normalize().values)
+    assert np.array_equal(vectorbatch.normalize([[0, 0, 0]]), [[0, 0, 0]])
+
+
+def test_projections_against_one_shared_axis():
+
+    vectors = [[1, 0, 0], [0, 5, 0], [3, 4, 5]]
+
+    assert np.array_equal(vectorbatch.project_onto(vectors, [0, 1, 0]), [[0, 0, 0], [0, 5, 0], [0, 4, 0]])
+    assert np.array_equal(vectorbatch.reject_from(vectors, [0, 1, 0]), [[1, 0, 0], [0, 0, 0], [3, 0, 5]])
+    assert np.array_equal(vectorbatch.component_along(vectors, [0, 2, 0]), [0, 5, 4])
+    assert np.array_equal(vectorbatch.reflect(vectors, [0, 1, 0]), [[1, 0, 0], [0, -5, 0], [3, -4, 5]])
+    assert np.array_equal(vectorbatch.project_onto_plane(vectors, [0, 0, 1]), [[1, 0, 0], [0, 5, 0], [3, 4, 0]])
+
+
+def test_projections_against_one_axis_per_vector():
+
+    vectors = [[3, 4, 5], [3, 4, 5]]
+    axes = [[1, 0, 0], [0, 0, 2]]
+
+    assert np.array_equal(vectorbatch.project_onto(vectors, axes), [[3, 0, 0], [0, 0, 5]])
+    assert np.array_equal(vectorbatch.reject_from(vectors, axes), [[0, 4, 5], [3, 4, 0]])
+    assert np.array_equal(vectorbatch.component_along(vectors, axes), [3, 5])
+
+
+def test_projections_match_vector3():
+
+    rng = np.random.default_rng(0)
+    vectors, axes = rng.uniform(-10, 10, (2, 20, 3))
+
+    for name in ('project_onto', 'reject_from', 'project_onto_plane', 'reflect'):
+
+        expected = [getattr(Vector3(*v), name)(Vector3(*axis)).values for v, axis in zip(vectors, axes)]
+
+        assert np.allclose(getattr(vectorbatch, name)(vectors, axes), expected)
+
+    expected = [Vector3(*v).component_along(Vector3(*axis)) for v, axis in zip(vectors, axes)]
+
+    assert np.allclose(vectorbatch.component_along(vectors, axes), expected)
+
+
+def test_projections_onto_null_axis():
+
+    vectors = [[1, 2, 3], [4, 5, 6]]
+    axes = [[0, 0, 0], [0, 0, 1]]
+
+    assert np.array_equal(vectorbatch.component_along(vectors, axes), [0, 6])
+    assert np.array_equal(vectorbatch.project_onto(vectors, axes), [[0, 0, 0], [0, 0, 6]])
+    assert np.array_equal(vectorbatch.reject_from(vectors, axes), [[1, 2, 3], [4, 5, 0]])
+    assert np.array_equal(vectorbatch.reflect(vectors, axes), [[1, 2, 3], [4, 5, -6]])
+
+
+def test_vector_batch_caches():
+
+    batch = vectorbatch.VectorBatch([[3, 4, 0], [0, 0, 0]])
+
+    assert batch.unit is batch.unit
+    assert np.array_equal(batch.norm, [5, 0])
+    assert np.array_equal(batch.unit, [[0.6, 0.8, 0], [0, 0, 0]])
+
+    # The cached arrays are shared, so they can't be modified in place.
+    with pytest.raises(ValueError):
+
+        batch.unit[0] = 1
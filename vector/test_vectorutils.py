@@ -0,0 +1,154 @@
+import math
+import timeit
+
+from vectorutils import closestfloat, closestnum, pretty_sqrt
+
+
+def test_closestfloat_cleans_float_noise():
+
+    assert closestfloat(1.2000000000000002) == 1.2
+    assert closestfloat(1.2999999999999999) == 1.3
+
+
+def test_closestfloat_only_looks_at_the_decimals():
+
+    # The 0's / 9's of the integer part used to be taken for noise: 1000000.5 became 1.0, 39999995.77 became 4.0
+    assert closestfloat(1000000.5) == 1000000.5
+    assert closestfloat(-39999995.7694937) == -39999995.7694937
+    assert closestfloat(19.9999999) == 20
+    assert closestfloat(-1.9999999999) == -2
+    assert closestfloat(0.0999999999) == 0.1
+
+
+def test_closestfloat_keeps_scientific_notation():
+
+    # Cutting the string at the 0's used to drop the exponent, giving 1.25000727.
+    assert closestfloat(1.250007270000001e-15) == 1.250007270000001e-15
+    assert closestfloat(1e20) == 1e20
+    assert closestnum(1.250007270000001e-15) == 0
+
+
+def test_spherical_on_the_z_axis():
+
+    from vector3 import Spherical
+
+    assert Spherical(58.17216084335034, 1.3944198958223906, 3.141592653589793).values == (0, 0, -58.17216084335034)
+
+
+def test_pretty_sqrt():
+
+    assert pretty_sqrt(0) == '0'
+    assert pretty_sqrt(18) == '3 sqrt(2)'
+    assert pretty_sqrt(16) == '4'
+
+
+def test_trig_cache_matches_math():
+
+    from vectorutils import TrigCache, sincos
+
+    cache = TrigCache()
+
+    for angle in (0, 30, 45, 1.234, -90):
+
+        assert cache.sincos(angle) == (math.sin(angle), math.cos(angle))
+        assert cache.degrees[angle] == sincos(angle, degree=True)
+        assert cache.sincos(angle, degree=True) == (math.sin(math.radians(angle)), math.cos(math.radians(angle)))
+
+
+def test_trig_cache_counts_hits_and_misses():
+
+    from vectorutils import TrigCache
+
+    cache = TrigCache(count_hits=True)
+
+    for angle in (0, 30, 30, 45, 30):
+
+        cache.sincos(angle, degree=True)
+
+    cache.sincos(30)
+
+    assert cache.info() == {'hits': 2, 'misses': 4, 'size': 4, 'maxsize': 4096}
+
+    cache.clear()
+
+    assert cache.info() == {'hits': 0, 'misses': 0, 'size': 0, 'maxsize': 4096}
+    assert TrigCache().info()['hits'] is None
+
+
+def test_trig_cache_stops_storing_when_full():
+
+    from vectorutils import TrigCache
+
+    cache = TrigCache(maxsize=3, count_hits=True)
+
+    for angle in range(5):
+
+        assert cache.sincos(angle) == (math.sin(angle), math.cos(angle))
+
+    assert cache.info() == {'hits': 0, 'misses': 5, 'size': 3, 'maxsize': 3}
+    assert list(cache.radians) == [0, 1, 2]
+
+    # The stored angles are kept, the others are computed again every time.
+    cache.sincos(0)
+    cache.sincos(4)
+
+    assert cache.info() == {'hits': 1, 'misses': 6, 'size': 3, 'maxsize': 3}
+
+    disabled = TrigCache(maxsize=0)
+    disabled.sincos(1)
+
+    assert len(disabled) == 0
+
+
+def test_trig_cache_preload():
+
+    from vectorutils import TrigCache
+
+    cache = TrigCache(maxsize=4, count_hits=True)
+    cache.preload(range(0, 360, 60), degree=True)
+
+    assert list(cache.degrees) == [0, 60, 120, 180]
+    assert cache.info() == {'hits': 0, 'misses': 0, 'size': 4, 'maxsize': 4}
+
+    cache.sincos(60, degree=True)
+
+    assert cache.info()['hits'] == 1
+
+
+def test_constructors_without_trig_cache():
+
+    from vector3 import Polar, Cylindrical, Spherical
+    from vectorutils import TrigCache
+
+    cache = TrigCache()
+
+    assert Polar(2, 30, degree=True, trig_cache=None) == Polar(2, 30, degree=True, trig_cache=cache)
+    assert Cylindrical(2, 1.2, 3, trig_cache=None) == Cylindrical(2, 1.2, 3, trig_cache=cache)
+    assert Spherical(2, 45, 60, degree=True, trig_cache=None) == Spherical(2, 45, 60, degree=True, trig_cache=cache)
+    assert sorted(cache.degrees) == [30, 45, 60]
+    assert list(cache.radians) == [1.2]
+
+
+def test_trig_cache_beats_recomputing():
+
+    from vectorutils import TrigCache
+
+    angles = list(range(0, 360, 5)) * 200
+    cache = TrigCache()
+    cache.preload(angles, degree=True)
+    table = cache.degrees
+
+    def cached():
+
+        for angle in angles:
+
+            sin_angle, cos_angle = table[angle]
+
+    def computed():
+
+        for angle in angles:
+
+            radians = math.radians(angle)
+            sin_angle, cos_angle = math.sin(radians), math.cos(radians)
+
+    assert min(timeit.repeat(cached, number=1, repeat=5)) < min(timeit.repeat(computed, number=1, repeat=5))
@@ -1,8 +1,9 @@
 #pylint: disable=not-an-iterable
 
 import math
-from typing import Union
-from vectorutils import closestnum, where_is_pi, pretty_sqrt
+import operator
+from typing import Any, Callable, Optional, Union
+from vectorutils import closestnum, where_is_pi, pretty_sqrt, sincos, TrigCache, trig_cache
 
 RealNumber = Scalar = Union[int, float]
 Coordinate = Union[list, tuple]
@@ -59,7 +60,19 @@ class Vector3:
         self.r = closestnum(math.sqrt(sum_squared_2d_components))
         self.rho = closestnum(math.sqrt(sum_squared_3d_components))
         self.theta = closestnum(math.atan2(self.y, self.x))
-        self.phi = closestnum(math.acos(self.z / self.rho))
+
+        # The null vector has no direction, phi is taken as 0 for it.
+        if self.rho == 0:
+
+            self.phi = 0
+
+        else:
+
+            # rho is snapped by closestnum, so z / rho can end up slightly out of [-1, 1].
+            self.phi = closestnum(math.acos(max(-1, min(1, self.z / self.rho))))
+
+        # rho is the norm, so there's no need to compute it again later.
+        self._norm_cache = (self.values, self.rho)
 
     def __len__(self) -> int:
 
@@ -203,39 +216,83 @@ class Vector3:
         '''
         Returns the angle between two vectors
         e.g. Vector3(1, 2, 3).angle(Vector3(2, 4, 6)) == 0
+
+        The cosine is clamped to [-1, 1], so rounding can't push (anti)parallel vectors out of the domain of acos.
+        It is computed from the unrounded dot product and squared norms: closestnum would snap the dot product
+        of tiny vectors to 0, and a snapped norm is enough to move the angle of (anti)parallel vectors.
         '''
 
-        angle_radians = math.acos(self.dot(other) / (self.norm * other.norm))
-        angle_degrees = 180 / math.pi * angle_radians
+        cosine = self._raw_dot(other) / math.sqrt(self._raw_dot(self) * other._raw_dot(other))
+        angle_radians = math.acos(max(-1, min(1, cosine)))
+
+        if pretty_print:
+
+            return self._pretty_angle(angle_radians, degree)
 
         if degree:
 
-            if pretty_print:
+            return closestnum(180 / math.pi * angle_radians)
 
-                return f'{angle_degrees:.2f}º'
+        return closestnum(angle_radians)
 
-            return closestnum(angle_degrees)
+    @staticmethod
+    def _pretty_angle(angle_radians: float, degree: bool) -> str:
 
-        if pretty_print:
-            
-            if where_is_pi(angle_radians) != angle_radians:
-                
-                return f'{where_is_pi(angle_radians)} rad'
+        if degree:
 
-            return f'{angle_radians:.3f} rad'
+            angle_degrees = 180 / math.pi * angle_radians
 
-        return closestnum(angle_radians)
+            return f'{angle_degrees:.2f}º'
+
+        if where_is_pi(angle_radians) != angle_radians:
+
+            return f'{where_is_pi(angle_radians)} rad'
+
+        return f'{angle_radians:.3f} rad'
 
     def normalize(self) -> 'Vector3':
         '''
         Returns a normalized vector, i.e. a vector with the same direction with norm (magnitude) == 1
         e.g. Vector3(2, 0, 0).normalize() == Vector3(1, 0, 0)
+
+        The normalized vector is computed once and cached; every call returns a new copy of it,
+        so changing the vector returned doesn't affect later calls.
         '''
 
-        normalized = tuple(closestnum(a / self.norm) for a in self)
+        return self._cached('_unit_cache', self._compute_unit)._copy()
+
+    def _compute_unit(self) -> 'Vector3':
+
+        norm = self.norm
+        normalized = tuple(closestnum(a / norm) for a in self)
 
         return Vector3(*normalized)
 
+    def _cached(self, name: str, compute: Callable) -> Any:
+        '''
+        Returns compute(), only calling it the first time: the result is stored along with
+        self.values, and recomputed only if the components of the vector are ever replaced.
+        '''
+
+        cache = self.__dict__.get(name)
+
+        if cache is None or cache[0] is not self.values:
+
+            cache = (self.values, compute())
+            self.__dict__[name] = cache
+
+        return cache[1]
+
+    def _copy(self) -> 'Vector3':
+        '''
+        Returns a new vector with the same attributes (caches included), without going through __init__ again.
+        '''
+
+        duplicate = object.__new__(type(self))
+        duplicate.__dict__.update(self.__dict__)
+
+        return duplicate
+
     def _scalar_multiplication(self, other: RealNumber) -> 'Vector3':
         '''
         Returns the multiplication between a vector and a scalar
@@ -303,6 +360,94 @@ class Vector3:
 
         return Vector3(x, y, z)
 
+    def component_along(self, axis: Vector) -> float:
+        '''
+        Returns the scalar component of the vector along an axis, i.e. a • b / |b|
+        e.g. Vector3(3, 4, 0).component_along(Vector3(2, 0, 0)) == 3
+
+        A null axis raises a ZeroDivisionError, like normalize does (the vectorbatch counterpart returns 0 instead).
+        '''
+
+        if type(axis) in (list, tuple):
+
+            axis = Vector3(*axis)
+
+        return closestnum(self._raw_dot(axis) / math.sqrt(axis._raw_dot(axis)))
+
+    def project_onto(self, axis: Vector) -> 'Vector3':
+        '''
+        Returns the projection of the vector onto an axis, i.e. (a • b / b • b) b
+        e.g. Vector3(3, 4, 5).project_onto(Vector3(0, 2, 0)) == Vector3(0, 4, 0)
+
+        A null axis raises a ZeroDivisionError, like normalize does (the vectorbatch counterpart returns a null vector instead).
+        '''
+
+        if type(axis) in (list, tuple):
+
+            axis = Vector3(*axis)
+
+        ratio = self._raw_dot(axis) / axis._raw_dot(axis)
+
+        projected_components = tuple(closestnum(ratio * b) for b in axis)
+
+        return Vector3(*projected_components)
+
+    def reject_from(self, axis: Vector) -> 'Vector3':
+        '''
+        Returns the rejection of the vector from an axis, i.e. the part of the vector
+        perpendicular to it: a - (a • b / b • b) b
+        e.g. Vector3(3, 4, 5).reject_from(Vector3(0, 2, 0)) == Vector3(3, 0, 5)
+
+        A null axis raises a ZeroDivisionError, like normalize does (the vectorbatch counterpart leaves the vector as it is instead).
+        '''
+
+        if type(axis) in (list, tuple):
+
+            axis = Vector3(*axis)
+
+        ratio = self._raw_dot(axis) / axis._raw_dot(axis)
+
+        rejected_components = tuple(closestnum(a - ratio * b) for a, b in zip(self, axis))
+
+        return Vector3(*rejected_components)
+
+    def project_onto_plane(self, normal: Vector) -> 'Vector3':
+        '''
+        Returns the projection of the vector onto the plane with the given normal,
+        which is the same as the rejection from the normal.
+        e.g. Vector3(3, 4, 5).project_onto_plane(Vector3(0, 0, 1)) == Vector3(3, 4, 0)
+
+        A null normal raises a ZeroDivisionError, like normalize does (the vectorbatch counterpart leaves the vector as it is instead).
+        '''
+
+        return self.reject_from(normal)
+
+    def reflect(self, normal: Vector) -> 'Vector3':
+        '''
+        Returns the reflection of the vector across the plane with the given normal,
+        i.e. a - 2 (a • n / n • n) n
+        e.g. Vector3(1, -1, 0).reflect(Vector3(0, 1, 0)) == Vector3(1, 1, 0)
+
+        A null normal raises a ZeroDivisionError, like normalize does (the vectorbatch counterpart leaves the vector as it is instead).
+        '''
+
+        if type(normal) in (list, tuple):
+
+            normal = Vector3(*normal)
+
+        ratio = 2 * self._raw_dot(normal) / normal._raw_dot(normal)
+
+        reflected_components = tuple(closestnum(a - ratio * b) for a, b in zip(self, normal))
+
+        return Vector3(*reflected_components)
+
+    def _raw_dot(self, other: 'Vector3') -> RealNumber:
+        '''
+        Dot product without the closestnum rounding, for intermediate results.
+        '''
+
+        return self.x * other.x + self.y * other.y + self.z * other.z
+
     @property
     def dimension(self) -> int:
         '''
@@ -329,13 +474,38 @@ class Vector3:
     @property
     def norm(self) -> float:
         '''
-        Returns the norm (magnitude) of the vector.
+        Returns the norm (magnitude) of the vector, computed once per vector.
+        '''
+
+        return self._cached('_norm_cache', self._compute_norm)
+
+    @property
+    def norm_squared(self) -> RealNumber:
+        '''
+        Returns the squared norm of the vector, computed once per vector.
+        Comparing squared norms gives the same order as comparing norms, without the square root.
         '''
 
+        return self._cached('_norm_squared_cache', self._compute_norm_squared)
+
+    @property
+    def unit(self) -> 'Vector3':
+        '''
+        The normalized vector, same as normalize().
+        '''
+
+        return self.normalize()
+
+    def _compute_norm(self) -> float:
+
         components_square = tuple(component ** 2 for component in self)
 
         return closestnum(math.sqrt(sum(components_square)))
 
+    def _compute_norm_squared(self) -> RealNumber:
+
+        return closestnum(sum(component ** 2 for component in self))
+
     def cylindrical_repr(self) -> str:
         '''
         Outputs the cylindrical coordinate of the vector, and in a pretty manner.
@@ -462,20 +632,28 @@ class MagAngle(Vector3):
     '''
     MagAngle == Magnitude and Angle.
     Get a Vector3 object giving the norm of the vector and the angle with the horizon.
+
+    The (sin, cos) pair of the angle is looked up in trig_cache (the shared module cache by default),
+    passing trig_cache=None computes it directly instead.
     '''
 
-    def __init__(self, norm: RealNumber, angle: RealNumber = 0, degree: bool = False, polar_repr: bool = False):
+    def __init__(self, norm: RealNumber, angle: RealNumber = 0, degree: bool = False, polar_repr: bool = False,
+                 trig_cache: Optional[TrigCache] = trig_cache):
 
         self.ang = angle
 
         self._polar_repr = polar_repr
 
-        if degree:
+        if trig_cache is None:
+
+            sin_angle, cos_angle = sincos(angle, degree)
+
+        else:
 
-            angle = math.radians(angle)
+            sin_angle, cos_angle = (trig_cache.degrees if degree else trig_cache.radians)[angle]
 
-        self.x = closestnum(norm * math.cos(angle))
-        self.y = closestnum(norm * math.sin(angle))
+        self.x = closestnum(norm * cos_angle)
+        self.y = closestnum(norm * sin_angle)
 
         super().__init__(self.x, self.y)
 
@@ -498,12 +676,13 @@ class Polar(MagAngle):
     Returns a 2D Vector3 object (i.e. a Vector3 with the z component = 0).
     '''
 
-    def __init__(self, r: RealNumber, theta: RealNumber = 0, degree: bool = False, polar_repr: bool = False):
+    def __init__(self, r: RealNumber, theta: RealNumber = 0, degree: bool = False, polar_repr: bool = False,
+                 trig_cache: Optional[TrigCache] = trig_cache):
 
         self.r = r
         self.theta = theta
 
-        super().__init__(r, theta, degree, polar_repr)
+        super().__init__(r, theta, degree, polar_repr, trig_cache)
 
 
 class Cylindrical(Vector3):
@@ -513,9 +692,11 @@ class Cylindrical(Vector3):
     cylindrical coordinate of the tip of the vector.
     The convention for r, theta and z are shown in this study guide:
     http://sites.science.oregonstate.edu/math/home/programs/undergrad/CalculusQuestStudyGuides/vcalc/coord/coord.html
+    trig_cache works the same way as in MagAngle.
     '''
 
-    def __init__(self, r: RealNumber, theta: RealNumber, z: RealNumber, degree: bool = False, cylindrical_repr: bool = False):
+    def __init__(self, r: RealNumber, theta: RealNumber, z: RealNumber, degree: bool = False, cylindrical_repr: bool = False,
+                 trig_cache: Optional[TrigCache] = trig_cache):
 
         self.r = r
         self.theta = theta
@@ -523,12 +704,16 @@ class Cylindrical(Vector3):
 
         self._cylindrical_repr = cylindrical_repr
 
-        if degree:
+        if trig_cache is None:
+
+            sin_theta, cos_theta = sincos(theta, degree)
 
-            theta = math.radians(theta)
+        else:
 
-        self.x = closestnum(r * math.cos(theta))
-        self.y = closestnum(r * math.sin(theta))
+            sin_theta, cos_theta = (trig_cache.degrees if degree else trig_cache.radians)[theta]
+
+        self.x = closestnum(r * cos_theta)
+        self.y = closestnum(r * sin_theta)
 
         super().__init__(self.x, self.y, self.z)
 
@@ -552,9 +737,11 @@ class Spherical(Vector3):
     Vector3 object based on the spherical coordinate of the tip of the vector
     Conventions for rho, theta and phi are based on the following study guide:
     http://sites.science.oregonstate.edu/math/home/programs/undergrad/CalculusQuestStudyGuides/vcalc/coord/coord.html
+    trig_cache works the same way as in MagAngle.
     '''
 
-    def __init__(self, rho: RealNumber, theta: RealNumber, phi: RealNumber, degree: bool = False, spherical_repr: bool = False):
+    def __init__(self, rho: RealNumber, theta: RealNumber, phi: RealNumber, degree: bool = False, spherical_repr: bool = False,
+                 trig_cache: Optional[TrigCache] = trig_cache):
 
         self.rho = rho
         self.theta = theta
@@ -562,14 +749,21 @@ class Spherical(Vector3):
 
         self._spherical_repr = spherical_repr
 
-        if degree:
+        if trig_cache is None:
 
-            theta = math.radians(theta)
-            phi = math.radians(phi)
+            sin_theta, cos_theta = sincos(theta, degree)
+            sin_phi, cos_phi = sincos(phi, degree)
 
-        self.x = closestnum(rho * math.sin(phi) * math.cos(theta))
-        self.y = closestnum(rho * math.sin(phi) * math.sin(theta))
-        self.z = closestnum(rho * math.cos(phi))
+        else:
+
+            table = trig_cache.degrees if degree else trig_cache.radians
+
+            sin_theta, cos_theta = table[theta]
+            sin_phi, cos_phi = table[phi]
+
+        self.x = closestnum(rho * sin_phi * cos_theta)
+        self.y = closestnum(rho * sin_phi * sin_theta)
+        self.z = closestnum(rho * cos_phi)
 
         super().__init__(self.x, self.y, self.z)
 
@@ -588,6 +782,437 @@ class Spherical(Vector3):
         return str((self.x, self.y, self.z))
 
 
+class FloatVector3(Vector3):
+
+    '''
+    A Vector3 with plain IEEE float semantics: components are stored as floats and
+    results are never snapped with closestnum, so there is no float cleanup overhead.
+    The cylindrical / spherical attributes (r, rho, theta, phi) are only computed when accessed.
+
+    Operations between FloatVector3 / IntVector3 objects, lists, tuples, ints and floats
+    are dispatched through a lookup table instead of the generic type checks.
+    Subclasses are dispatched like the class they derive from, and give FloatVector3 / IntVector3 results.
+    Anything else (e.g. a regular Vector3) falls back to the Vector3 behaviour.
+    '''
+
+    _component_type = float
+
+    def __init__(self, *args: Coordinate):
+
+        self.args = args
+
+        convert = self._component_type
+        x, y, z = (args + (0, 0, 0))[:3]
+
+        self.x = convert(x)
+        self.y = convert(y)
+        self.z = convert(z)
+
+        self.values = (self.x, self.y, self.z)
+
+    def __add__(self, other: Vector) -> 'Vector3':
+
+        result_class, other = self._promote(other)
+
+        if result_class is None:
+
+            return super().__add__(other)
+
+        return result_class(self.x + other.x, self.y + other.y, self.z + other.z)
+
+    def __radd__(self, other: Vector) -> 'Vector3':
+
+        return self.__add__(other)
+
+    def __sub__(self, other: Vector) -> 'Vector3':
+
+        result_class, other = self._promote(other)
+
+        if result_class is None:
+
+            return super().__sub__(other)
+
+        return result_class(self.x - other.x, self.y - other.y, self.z - other.z)
+
+    def __rsub__(self, other: Vector) -> 'Vector3':
+
+        result_class, other = self._promote(other)
+
+        if result_class is None:
+
+            return super().__rsub__(other)
+
+        return result_class(other.x - self.x, other.y - self.y, other.z - self.z)
+
+    def __mul__(self, other: Union[Scalar, Vector]) -> Union[RealNumber, 'Vector3']:
+
+        result_class = self._scalar_promote(other)
+
+        if result_class is None:
+
+            return self.dot(other)
+
+        return result_class(self.x * other, self.y * other, self.z * other)
+
+    def __rmul__(self, other: Union[Scalar, Vector]) -> Union[RealNumber, 'Vector3']:
+
+        return self.__mul__(other)
+
+    def __truediv__(self, other: Scalar) -> 'Vector3':
+
+        if self._scalar_promote(other) is not None:
+
+            return FloatVector3(self.x / other, self.y / other, self.z / other)
+
+        return super().__truediv__(other)
+
+    def __pow__(self, other: Vector) -> 'Vector3':
+
+        return self.cross(other)
+
+    def __rpow__(self, other: Vector) -> 'Vector3':
+
+        result_class, other = self._promote(other)
+
+        if result_class is None:
+
+            return super().__rpow__(other)
+
+        return other.cross(self)
+
+    def __eq__(self, other: Vector) -> bool:
+
+        result_class, other = self._promote(other)
+
+        if result_class is None:
+
+            return super().__eq__(other)
+
+        return self.values == other.values
+
+    def __gt__(self, other: Union[Scalar, Vector]) -> bool:
+
+        if isinstance(other, FloatVector3):
+
+            return self.norm_squared > other.norm_squared
+
+        own, others = self._comparison_keys(other)
+
+        return own > others
+
+    def __lt__(self, other: Union[Scalar, Vector]) -> bool:
+
+        if isinstance(other, FloatVector3):
+
+            return self.norm_squared < other.norm_squared
+
+        own, others = self._comparison_keys(other)
+
+        return own < others
+
+    def __ge__(self, other: Union[Scalar, Vector]) -> bool:
+
+        if isinstance(other, FloatVector3):
+
+            return self.norm_squared >= other.norm_squared
+
+        own, others = self._comparison_keys(other)
+
+        return own >= others
+
+    def __le__(self, other: Union[Scalar, Vector]) -> bool:
+
+        if isinstance(other, FloatVector3):
+
+            return self.norm_squared <= other.norm_squared
+
+        own, others = self._comparison_keys(other)
+
+        return own <= others
+
+    def _promote(self, other: Vector) -> tuple:
+        '''
+        Returns the class of the result of an operation between self and another vector,
+        along with the other vector converted to a FloatVector3 / IntVector3 if it was a list or a tuple.
+        The class is None when the other vector isn't a specialized one.
+        '''
+
+        result_class = _VECTOR_PROMOTIONS.get((type(self), type(other)))
+
+        if result_class is None:
+
+            if type(other) in (list, tuple):
+
+                other = _specialized_vector(*other)
+
+            result_class = _resolve_promotion(_VECTOR_PROMOTIONS, type(self), type(other))
+
+        return result_class, other
+
+    def _scalar_promote(self, other: Scalar) -> type:
+        '''
+        Returns the class of the result of multiplying self by a scalar, None if other isn't an int or a float.
+        '''
+
+        result_class = _SCALAR_PROMOTIONS.get((type(self), type(other)))
+
+        if result_class is None:
+
+            result_class = _resolve_promotion(_SCALAR_PROMOTIONS, type(self), type(other))
+
+        return result_class
+
+    def _comparison_keys(self, other: Union[Scalar, Vector]) -> tuple:
+        '''
+        Vectors are compared by norm. Between specialized vectors the squared norms are compared
+        instead, which gives the same order without a square root (and exactly, for IntVector3).
+        The comparison operators check for another specialized vector themselves, this handles the rest.
+        '''
+
+        if isinstance(other, (int, float)):
+
+            return self.norm, other
+
+        if type(other) in (list, tuple):
+
+            return self.norm_squared, _specialized_vector(*other).norm_squared
+
+        return self.norm, other.norm
+
+    def dot(self, other: Vector) -> RealNumber:
+        '''
+        Returns the dot product between two vectors, without any rounding.
+        '''
+
+        result_class, other = self._promote(other)
+
+        if result_class is None:
+
+            return super().dot(other)
+
+        return self.x * other.x + self.y * other.y + self.z * other.z
+
+    def cross(self, other: Vector) -> 'Vector3':
+        '''
+        Returns the cross product between two vectors, without any rounding.
+        '''
+
+        result_class, other = self._promote(other)
+
+        if result_class is None:
+
+            return super().cross(other)
+
+        return result_class(self.y * other.z - self.z * other.y,
+                            self.z * other.x - self.x * other.z,
+                            self.x * other.y - self.y * other.x)
+
+    def angle(self, other: Vector, degree: bool = False, pretty_print: bool = False) -> Union[float, str]:
+        '''
+        Returns the angle between two vectors, without any rounding.
+        The cosine is clamped to [-1, 1], so (anti)parallel vectors give 0 / pi
+        instead of a math domain error, the same as vectorbatch.angle.
+        '''
+
+        result_class, other = self._promote(other)
+
+        if result_class is None:
+
+            return super().angle(other, degree, pretty_print)
+
+        cosine = self.dot(other) / (self.norm * other.norm)
+        angle_radians = math.acos(max(-1.0, min(1.0, cosine)))
+
+        if pretty_print:
+
+            return self._pretty_angle(angle_radians, degree)
+
+        if degree:
+
+            return math.degrees(angle_radians)
+
+        return angle_radians
+
+    def component_along(self, axis: Vector) -> float:
+        '''
+        Returns the scalar component of the vector along an axis, without any rounding.
+        A null axis raises a ZeroDivisionError, like Vector3.component_along.
+        '''
+
+        result_class, axis = self._promote(axis)
+
+        if result_class is None:
+
+            return super().component_along(axis)
+
+        return (self.x * axis.x + self.y * axis.y + self.z * axis.z) / axis.norm
+
+    def project_onto(self, axis: Vector) -> 'FloatVector3':
+        '''
+        Returns the projection of the vector onto an axis as a FloatVector3, without any rounding.
+        A null axis raises a ZeroDivisionError, like Vector3.project_onto.
+        '''
+
+        result_class, axis = self._promote(axis)
+
+        if result_class is None:
+
+            return super().project_onto(axis)
+
+        ratio = (self.x * axis.x + self.y * axis.y + self.z * axis.z) / axis.norm_squared
+
+        return FloatVector3(ratio * axis.x, ratio * axis.y, ratio * axis.z)
+
+    def reject_from(self, axis: Vector) -> 'FloatVector3':
+        '''
+        Returns the rejection of the vector from an axis as a FloatVector3, without any rounding.
+        A null axis raises a ZeroDivisionError, like Vector3.reject_from.
+        '''
+
+        result_class, axis = self._promote(axis)
+
+        if result_class is None:
+
+            return super().reject_from(axis)
+
+        ratio = (self.x * axis.x + self.y * axis.y + self.z * axis.z) / axis.norm_squared
+
+        return FloatVector3(self.x - ratio * axis.x, self.y - ratio * axis.y, self.z - ratio * axis.z)
+
+    def reflect(self, normal: Vector) -> 'FloatVector3':
+        '''
+        Returns the reflection of the vector across the plane with the given normal as a FloatVector3,
+        without any rounding. A null normal raises a ZeroDivisionError, like Vector3.reflect.
+        '''
+
+        result_class, normal = self._promote(normal)
+
+        if result_class is None:
+
+            return super().reflect(normal)
+
+        ratio = 2 * (self.x * normal.x + self.y * normal.y + self.z * normal.z) / normal.norm_squared
+
+        return FloatVector3(self.x - ratio * normal.x, self.y - ratio * normal.y, self.z - ratio * normal.z)
+
+    def _compute_unit(self) -> 'FloatVector3':
+        '''
+        The normalized vector is a FloatVector3, without any rounding.
+        '''
+
+        norm = self.norm
+
+        return FloatVector3(self.x / norm, self.y / norm, self.z / norm)
+
+    def _compute_norm_squared(self) -> RealNumber:
+        '''
+        The squared norm is exact (an int) for IntVector3.
+        '''
+
+        return self.x * self.x + self.y * self.y + self.z * self.z
+
+    def _compute_norm(self) -> float:
+
+        return math.sqrt(self.norm_squared)
+
+    @property
+    def r(self) -> float:
+
+        return math.hypot(self.x, self.y)
+
+    @property
+    def rho(self) -> float:
+
+        return self.norm
+
+    @property
+    def theta(self) -> float:
+
+        return math.atan2(self.y, self.x)
+
+    @property
+    def phi(self) -> float:
+
+        rho = self.norm
+
+        if rho == 0:
+
+            return 0.0
+
+        return math.acos(self.z / rho)
+
+
+class IntVector3(FloatVector3):
+
+    '''
+    A Vector3 for integer lattice vectors: arithmetic is exact and results stay ints.
+    Sums, differences, cross products and products with ints are IntVector3 objects,
+    dot products and squared norms are ints.
+
+    Mixing in floats or FloatVector3 objects promotes the result to FloatVector3,
+    and so does division, normalize and everything else that can't stay on the lattice.
+    Non-integer components are rejected with a TypeError instead of being truncated.
+    '''
+
+    _component_type = staticmethod(operator.index)
+
+
+def _specialized_vector(*components: RealNumber) -> FloatVector3:
+    '''
+    Builds an IntVector3 when every component is an int, a FloatVector3 otherwise.
+    '''
+
+    if all(type(component) is int for component in components):
+
+        return IntVector3(*components)
+
+    return FloatVector3(*components)
+
+
+# (type(self), type(other)) -> class of the result, for the specialized vectors.
+_VECTOR_PROMOTIONS = {
+    (IntVector3, IntVector3): IntVector3,
+    (IntVector3, FloatVector3): FloatVector3,
+    (FloatVector3, IntVector3): FloatVector3,
+    (FloatVector3, FloatVector3): FloatVector3,
+}
+
+_SCALAR_PROMOTIONS = {
+    (IntVector3, int): IntVector3,
+    (IntVector3, float): FloatVector3,
+    (FloatVector3, int): FloatVector3,
+    (FloatVector3, float): FloatVector3,
+}
+
+
+def _resolve_promotion(table: dict, self_type: type, other_type: type) -> type:
+    '''
+    Looks up a pair of types the promotion table doesn't know about, e.g. subclasses of FloatVector3
+    or of float, by resolving each type to the specialized vector / scalar class it derives from.
+    The result is stored in the table, so the next lookup is a single dict access again.
+    Returns None when the pair still isn't in the table (e.g. with a regular Vector3).
+    '''
+
+    result_class = table.get((_base_type(self_type), _base_type(other_type)))
+
+    if result_class is not None:
+
+        table[(self_type, other_type)] = result_class
+
+    return result_class
+
+
+def _base_type(cls: type) -> type:
+
+    for base in (IntVector3, FloatVector3, int, float):
+
+        if issubclass(cls, base):
+
+            return base
+
+    return cls
+
+
 def angle(a: 'Vector3', b: 'Vector3', degree: bool = False) -> RealNumber:
 
     if degree:
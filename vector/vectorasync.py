@@ -0,0 +1,222 @@
+import asyncio
+from concurrent.futures import Executor
+from contextlib import suppress
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Optional
+
+_DONE = object()
+
+
+def _call_each(func: Callable, batch: list) -> list:
+
+    return [func(item) for item in batch]
+
+
+def _call_batch(func: Callable, batch: Any) -> list:
+
+    return list(func(batch))
+
+
+async def micro_batches(source: AsyncIterator, batch_size: int = 256, max_latency: float = 0.005) -> AsyncIterator[list]:
+    '''
+    Groups the items of an async iterator into lists of at most batch_size items.
+
+    A batch is also let go as soon as its first item has waited max_latency seconds,
+    so a slow trickle of vectors isn't held back waiting for a full batch.
+    Closing the batches early closes the source as well.
+    '''
+
+    loop = asyncio.get_running_loop()
+    iterator = source.__aiter__()
+
+    next_item = None
+    batch = []
+    deadline = 0.0
+
+    try:
+
+        while True:
+
+            if next_item is None:
+
+                next_item = asyncio.ensure_future(iterator.__anext__())
+
+            timeout = max(deadline - loop.time(), 0) if batch else None
+            done, _ = await asyncio.wait({next_item}, timeout=timeout)
+
+            if not done:
+
+                yield batch
+                batch = []
+                continue
+
+            finished, next_item = next_item, None
+
+            try:
+
+                item = finished.result()
+
+            except StopAsyncIteration:
+
+                break
+
+            if not batch:
+
+                deadline = loop.time() + max_latency
+
+            batch.append(item)
+
+            if len(batch) >= batch_size:
+
+                yield batch
+                batch = []
+
+        if batch:
+
+            yield batch
+
+    finally:
+
+        if next_item is not None:
+
+            next_item.cancel()
+            await asyncio.wait({next_item})
+
+        close = getattr(iterator, 'aclose', None)
+
+        if close is not None:
+
+            await close()
+
+
+async def _run_batches(call: Callable, batches: AsyncIterator, executor: Optional[Executor], max_pending: int) -> AsyncIterator[list]:
+    '''
+    Sends every batch to the executor and yields the results, batch by batch, in order.
+
+    At most max_pending batches are in flight: a batch takes one of max_pending slots before it is
+    submitted, and gives it back once its results have been consumed. While every slot is taken,
+    no more batches are submitted and the source isn't read further than the next batch (backpressure).
+
+    When the consumer stops early, the batches that haven't started running are cancelled
+    and the batches iterator is closed.
+    '''
+
+    loop = asyncio.get_running_loop()
+    slots = asyncio.Semaphore(max_pending)
+    pending = asyncio.Queue()
+
+    async def submit() -> None:
+
+        try:
+
+            async for batch in batches:
+
+                await slots.acquire()
+                pending.put_nowait(loop.run_in_executor(executor, call, batch))
+
+        except Exception as error:
+
+            pending.put_nowait(error)
+
+        pending.put_nowait(_DONE)
+
+    producer = asyncio.ensure_future(submit())
+
+    try:
+
+        while True:
+
+            future = await pending.get()
+
+            if future is _DONE:
+
+                break
+
+            if isinstance(future, Exception):
+
+                raise future
+
+            yield await future
+
+            slots.release()
+
+    finally:
+
+        producer.cancel()
+
+        with suppress(asyncio.CancelledError):
+
+            await producer
+
+        # Batches submitted but never consumed: drop the ones that haven't started yet.
+        while not pending.empty():
+
+            future = pending.get_nowait()
+
+            if isinstance(future, asyncio.Future):
+
+                future.cancel()
+
+        close = getattr(batches, 'aclose', None)
+
+        if close is not None:
+
+            await close()
+
+
+async def map_vectors(func: Callable, source: AsyncIterator, batch_size: int = 256, max_latency: float = 0.005,
+                      executor: Optional[Executor] = None, max_pending: int = 4) -> AsyncIterator:
+    '''
+    Applies func to every vector coming from an async iterator, off the event loop,
+    and yields the results in the same order as the vectors came in.
+
+    Vectors are grouped with micro_batches (batch_size / max_latency) and each batch runs
+    in the executor, so the event loop only pays for one hand-off per batch.
+    executor defaults to the loop's thread pool; since the Vector3 work is pure Python,
+    a ProcessPoolExecutor is what actually spreads it over several cores (func must then be picklable).
+
+    e.g.
+    async for unit in map_vectors(Vector3.normalize, incoming_directions()):
+        ...
+    '''
+
+    call = partial(_call_each, func)
+    batches = _run_batches(call, micro_batches(source, batch_size, max_latency), executor, max_pending)
+
+    try:
+
+        async for results in batches:
+
+            for result in results:
+
+                yield result
+
+    finally:
+
+        await batches.aclose()
+
+
+async def map_batches(batch_func: Callable, source: AsyncIterator, executor: Optional[Executor] = None,
+                      max_pending: int = 4) -> AsyncIterator[list]:
+    '''
+    Same as map_vectors, but for sources that already yield batches (e.g. arrays of shape (n, 3))
+    and functions that work on a whole batch at once, such as the ones in vectorbatch.
+    Yields the results of every batch as a list, in order.
+
+    e.g.
+    async for units in map_batches(vectorbatch.normalize, incoming_arrays()):
+        ...
+    '''
+
+    call = partial(_call_batch, batch_func)
+    batches = _run_batches(call, source, executor, max_pending)
+
+    try:
+
+        async for results in batches:
+
+            yield results
+
+    finally:
+
+        await batches.aclose()
@@ -0,0 +1,348 @@
+from functools import cached_property
+from typing import Union
+import numpy as np
+
+from vector3 import Vector3
+
+VectorLike = Union[list, tuple, np.ndarray, Vector3, 'VectorBatch']
+
+
+def as_vectors(vectors: VectorLike) -> np.ndarray:
+    '''
+    Turns a single vector or a sequence of vectors (lists, tuples, Vector3 objects or arrays)
+    into a float array of shape (n, 3).
+
+    Missing components are taken as 0, the same way Vector3 does:
+    e.g. as_vectors([1, 2]) == array([[1., 2., 0.]])
+
+    An empty sequence gives an empty (0, 3) batch. Vectors with more than 3 components raise a ValueError.
+    '''
+
+    if isinstance(vectors, VectorBatch):
+
+        return vectors.vectors
+
+    if isinstance(vectors, Vector3):
+
+        vectors = [vectors.values]
+
+    elif not isinstance(vectors, np.ndarray):
+
+        vectors = [vector.values if isinstance(vector, Vector3) else vector for vector in vectors]
+
+    array = np.asarray(vectors, dtype=float)
+
+    if array.ndim == 1 and array.size == 0:
+
+        return np.zeros((0, 3))
+
+    if array.ndim == 1:
+
+        array = array.reshape(1, -1)
+
+    if array.ndim != 2 or array.shape[-1] > 3:
+
+        raise ValueError(f'expected vectors of at most 3 components, got an array of shape {array.shape}')
+
+    if array.shape[-1] < 3:
+
+        array = np.pad(array, ((0, 0), (0, 3 - array.shape[-1])))
+
+    return array
+
+
+def snap(array: np.ndarray, tolerance: float = 1e-9) -> np.ndarray:
+    '''
+    Vectorized counterpart of closestint: every value within the tolerance
+    of an integer is replaced by that integer, everything else is left untouched.
+    e.g. snap(array([0.9999999999, 1.5])) == array([1., 1.5])
+    '''
+
+    rounded = np.round(array)
+
+    return np.where(np.abs(array - rounded) <= tolerance, rounded, array)
+
+
+def _dot(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+
+    return np.einsum('...i,...i->...', a, b)
+
+
+def _cross(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+
+    return np.cross(a, b)
+
+
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    '''
+    numerator / denominator, giving 0 wherever the denominator is 0.
+    '''
+
+    numerator, denominator = np.broadcast_arrays(numerator, denominator)
+
+    return np.divide(numerator, denominator, out=np.zeros(numerator.shape), where=denominator != 0)
+
+
+def _unit(vectors: np.ndarray, norms: np.ndarray) -> np.ndarray:
+
+    return _safe_divide(vectors, norms[..., np.newaxis])
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+
+    array.flags.writeable = False
+
+    return array
+
+
+def dot(a: VectorLike, b: VectorLike) -> np.ndarray:
+    '''
+    Row-wise dot product, the batch counterpart of Vector3.dot.
+    Either side can be a single vector, which is then used against every row of the other.
+    '''
+
+    return snap(_dot(as_vectors(a), as_vectors(b)))
+
+
+def cross(a: VectorLike, b: VectorLike) -> np.ndarray:
+    '''
+    Row-wise cross product, the batch counterpart of Vector3.cross.
+    Either side can be a single vector, which is then used against every row of the other.
+    '''
+
+    return snap(_cross(as_vectors(a), as_vectors(b)))
+
+
+def norm(vectors: VectorLike) -> np.ndarray:
+    '''
+    Returns the norm (magnitude) of every vector in the batch.
+    '''
+
+    vectors = as_vectors(vectors)
+
+    return snap(np.sqrt(_dot(vectors, vectors)))
+
+
+def normalize(vectors: VectorLike) -> np.ndarray:
+    '''
+    Batch counterpart of Vector3.normalize.
+    Null vectors can't be normalized, they are returned as null vectors instead of raising.
+    '''
+
+    vectors = as_vectors(vectors)
+
+    return snap(_unit(vectors, np.sqrt(_dot(vectors, vectors))))
+
+
+def triple_product(a: VectorLike, b: VectorLike, c: VectorLike) -> np.ndarray:
+    '''
+    Returns the scalar triple product a • (b x c) of every row,
+    i.e. the signed volume of the parallelepiped spanned by a, b and c.
+    '''
+
+    return snap(_dot(as_vectors(a), _cross(as_vectors(b), as_vectors(c))))
+
+
+def _projection_ratios(vectors: np.ndarray, axes: np.ndarray) -> np.ndarray:
+    '''
+    a • b / b • b for every row, as a column so it broadcasts against the axes.
+    Null axes give a ratio of 0.
+    '''
+
+    return _safe_divide(_dot(vectors, axes), _dot(axes, axes))[..., np.newaxis]
+
+
+def component_along(vectors: VectorLike, axes: VectorLike) -> np.ndarray:
+    '''
+    Batch counterpart of Vector3.component_along.
+    axes can be a single axis shared by every vector, or one axis per vector.
+    Null axes give a component of 0 instead of raising a ZeroDivisionError like Vector3 does.
+    '''
+
+    vectors, axes = as_vectors(vectors), as_vectors(axes)
+
+    return snap(_safe_divide(_dot(vectors, axes), np.sqrt(_dot(axes, axes))))
+
+
+def project_onto(vectors: VectorLike, axes: VectorLike) -> np.ndarray:
+    '''
+    Batch counterpart of Vector3.project_onto.
+    axes can be a single axis shared by every vector, or one axis per vector.
+    Null axes give a null projection instead of raising a ZeroDivisionError like Vector3 does.
+    '''
+
+    vectors, axes = as_vectors(vectors), as_vectors(axes)
+
+    return snap(_projection_ratios(vectors, axes) * axes)
+
+
+def reject_from(vectors: VectorLike, axes: VectorLike) -> np.ndarray:
+    '''
+    Batch counterpart of Vector3.reject_from.
+    axes can be a single axis shared by every vector, or one axis per vector.
+    Null axes leave the vector as it is instead of raising a ZeroDivisionError like Vector3 does.
+    '''
+
+    vectors, axes = as_vectors(vectors), as_vectors(axes)
+
+    return snap(vectors - _projection_ratios(vectors, axes) * axes)
+
+
+def project_onto_plane(vectors: VectorLike, normals: VectorLike) -> np.ndarray:
+    '''
+    Batch counterpart of Vector3.project_onto_plane.
+    normals can be a single plane normal shared by every vector, or one normal per vector.
+    Null normals leave the vector as it is instead of raising a ZeroDivisionError like Vector3 does.
+    '''
+
+    return reject_from(vectors, normals)
+
+
+def reflect(vectors: VectorLike, normals: VectorLike) -> np.ndarray:
+    '''
+    Batch counterpart of Vector3.reflect.
+    normals can be a single plane normal shared by every vector, or one normal per vector.
+    Null normals leave the vector as it is instead of raising a ZeroDivisionError like Vector3 does.
+    '''
+
+    vectors, normals = as_vectors(vectors), as_vectors(normals)
+
+    return snap(vectors - 2 * _projection_ratios(vectors, normals) * normals)
+
+
+def _angle(dots: np.ndarray, norms_product: np.ndarray, degree: bool) -> np.ndarray:
+    '''
+    Angles from the dot products and the products of the norms.
+    The cosine is clipped to [-1, 1] so (anti)parallel vectors don't give nan,
+    and taken as 0 for null vectors, which then come out perpendicular to everything.
+    '''
+
+    angles = np.arccos(np.clip(_safe_divide(dots, norms_product), -1, 1))
+
+    if degree:
+
+        angles = np.degrees(angles)
+
+    return snap(angles)
+
+
+def angle(a: VectorLike, b: VectorLike, degree: bool = False) -> np.ndarray:
+    '''
+    Batch counterpart of Vector3.angle, in radians unless degree is set.
+    Null vectors give pi / 2 instead of raising a ZeroDivisionError like Vector3 does.
+    '''
+
+    a, b = as_vectors(a), as_vectors(b)
+
+    return _angle(_dot(a, b), np.sqrt(_dot(a, a) * _dot(b, b)), degree)
+
+
+def to_cylindrical(vectors: VectorLike) -> np.ndarray:
+    '''
+    Returns the (r, theta, z) cylindrical coordinates of every vector,
+    the batch counterpart of the r, theta and z attributes of Vector3.
+    '''
+
+    vectors = as_vectors(vectors)
+
+    r = np.hypot(vectors[:, 0], vectors[:, 1])
+    theta = np.arctan2(vectors[:, 1], vectors[:, 0])
+
+    return snap(np.column_stack((r, theta, vectors[:, 2])))
+
+
+def to_spherical(vectors: VectorLike) -> np.ndarray:
+    '''
+    Returns the (rho, theta, phi) spherical coordinates of every vector,
+    the batch counterpart of the rho, theta and phi attributes of Vector3.
+    Null vectors get a phi of 0.
+    '''
+
+    vectors = as_vectors(vectors)
+
+    rho = np.sqrt(_dot(vectors, vectors))
+    theta = np.arctan2(vectors[:, 1], vectors[:, 0])
+    phi = np.arccos(np.clip(_safe_divide(vectors[:, 2], rho), -1, 1))
+
+    return snap(np.column_stack((rho, theta, phi)))
+
+
+def from_cylindrical(coordinates: VectorLike, degree: bool = False) -> np.ndarray:
+    '''
+    Batch counterpart of Cylindrical: turns rows of (r, theta, z) into cartesian vectors.
+    '''
+
+    r, theta, z = as_vectors(coordinates).T
+
+    if degree:
+
+        theta = np.radians(theta)
+
+    return snap(np.column_stack((r * np.cos(theta), r * np.sin(theta), z)))
+
+
+def from_spherical(coordinates: VectorLike, degree: bool = False) -> np.ndarray:
+    '''
+    Batch counterpart of Spherical: turns rows of (rho, theta, phi) into cartesian vectors.
+    '''
+
+    rho, theta, phi = as_vectors(coordinates).T
+
+    if degree:
+
+        theta, phi = np.radians(theta), np.radians(phi)
+
+    sin_phi = np.sin(phi)
+
+    return snap(np.column_stack((rho * sin_phi * np.cos(theta), rho * sin_phi * np.sin(theta), rho * np.cos(phi))))
+
+
+class VectorBatch:
+
+    '''
+    A batch of vectors that keeps its squared norms, norms and unit vectors once computed,
+    the batch counterpart of the cached Vector3.norm / norm_squared / normalize.
+
+    Meant for repeated geometric queries against the same vectors: e.g. the angles between
+    a fixed batch and many others only take one square root per vector of the batch.
+    The vectors shouldn't be modified in place once the batch is created.
+    The cached arrays are shared by every access, so they are read-only: copy them before modifying them.
+    VectorBatch objects can be given to every function of this module.
+    '''
+
+    def __init__(self, vectors: VectorLike):
+
+        self.vectors = as_vectors(vectors)
+
+    def __len__(self) -> int:
+
+        return len(self.vectors)
+
+    @cached_property
+    def norm_squared(self) -> np.ndarray:
+
+        return _read_only(snap(_dot(self.vectors, self.vectors)))
+
+    @cached_property
+    def norm(self) -> np.ndarray:
+
+        return _read_only(snap(np.sqrt(self.norm_squared)))
+
+    @cached_property
+    def unit(self) -> np.ndarray:
+        '''
+        Same as normalize(vectors): null vectors stay null.
+        '''
+
+        return _read_only(snap(_unit(self.vectors, self.norm)))
+
+    def angle(self, other: VectorLike, degree: bool = False) -> np.ndarray:
+        '''
+        Same as angle(vectors, other), using the cached norms of both sides when they are VectorBatch objects.
+        '''
+
+        if not isinstance(other, VectorBatch):
+
+            other = VectorBatch(other)
+
+        return _angle(_dot(self.vectors, other.vectors), self.norm * other.norm, degree)
@@ -38,26 +38,30 @@ def closestfloat(number: float) -> float:
     For instance: closestfloat(1.2000000000000002) == 1.2
                   closestfloat(1.2999999999999999) == 1.3
 
-    The way it works is by checking if there is a long string of 0's or 9's in the number. If it does, then
-    there's a strong chance this is a floating point precision situation; so the function converts
-    the number into a string, and split it where there's a lot of 0's or 9's; then takes the first item of
-    the formed list, which should be the precise number for the case of 0's. For 9's it also changes the
-    last digit before the long string of 9's to one digit up.
+    The way it works is by checking if there is a long string of 0's or 9's in the decimals of the number.
+    If there is, then there's a strong chance this is a floating point precision situation; so the number
+    is rounded to the decimals before that string: for 0's that just cuts the noise off, for 9's it also
+    carries one up into the last digit before them (e.g. 19.9999999 becomes 20.0).
+
+    Only the decimals are looked at, the integer part can have as many 0's or 9's as it likes
+    (e.g. 1000000.5 and 39999995.77 are left as they are).
+    Numbers written in scientific notation (e.g. 1.2500000000000001e-15) are left as they are,
+    since cutting their string would also cut the exponent off.
     '''
 
-    if 6 * '9' in str(number):
+    if 'e' in str(number):
 
-        number_string = str(number).split(6 * '9')[0]
-        if number_string[-1] == '.': number_string = number_string[:-1]
+        return number
 
-        last_digit = int(number_string[-1])
-        new_last_digit = str(last_digit + 1)
+    decimals = str(number).partition('.')[2]
 
-        number_string = number_string[:-1] + new_last_digit
+    for noise in (6 * '9', 6 * '0'):
 
-        return float(number_string)
+        if noise in decimals:
 
-    return float(str(number).split(6*'0')[0])
+            return round(number, len(decimals.split(noise)[0]))
+
+    return float(number)
 
 
 def closestnum(number: RealNumber) -> RealNumber:
@@ -126,7 +130,7 @@ def prime_factors(number: int):
 
 def pretty_sqrt(number: int) -> str:
 
-    if number != int(number):
+    if number != int(number) or number == 0:
 
         return f'{number}'
 
@@ -176,6 +180,137 @@ def remove_duplet(factors: list) -> None:
     factors.pop(0)
 
 
+def sincos(angle: RealNumber, degree: bool = False) -> tuple:
+    '''
+    Returns (sin(angle), cos(angle)), converting the angle from degrees first if needed.
+    '''
+
+    radians = math.radians(angle) if degree else angle
+
+    return (math.sin(radians), math.cos(radians))
+
+
+class _TrigTable(dict):
+
+    '''
+    The angle -> (sin, cos) table of one unit. A missing angle is computed with sincos
+    and stored, as long as the cache it belongs to isn't full.
+    '''
+
+    def __init__(self, cache: 'TrigCache', degree: bool):
+
+        super().__init__()
+
+        self.cache = cache
+        self.degree = degree
+
+    def __missing__(self, angle: RealNumber) -> tuple:
+
+        cache = self.cache
+        cache.misses += 1
+
+        pair = sincos(angle, self.degree)
+
+        if len(cache) < cache.maxsize:
+
+            self[angle] = pair
+
+        return pair
+
+
+class _CountingTrigTable(_TrigTable):
+
+    def __getitem__(self, angle: RealNumber) -> tuple:
+
+        if angle in self:
+
+            self.cache.hits += 1
+
+        return super().__getitem__(angle)
+
+
+class TrigCache:
+
+    '''
+    A bounded, angle keyed cache of (sin, cos) pairs.
+
+    Grids of Polar, Cylindrical and Spherical vectors usually repeat the same handful
+    of angles over and over, so instead of calling math.radians, math.sin and math.cos
+    for each vector, the pair is computed once per angle and looked up afterwards.
+    The values are exactly the ones sincos returns.
+
+    There is one dict per unit, radians and degrees, so a lookup is a single dict indexing:
+    e.g. trig_cache.degrees[30] == sincos(30, degree=True)
+
+    Once maxsize angles are stored the cache is full: new angles are still computed,
+    but they aren't stored anymore. A maxsize of 0 disables the cache.
+    Misses are always counted; hits only when count_hits is set, since counting
+    them costs about as much as the lookup itself.
+    '''
+
+    def __init__(self, maxsize: int = 4096, count_hits: bool = False):
+
+        self.maxsize = maxsize
+        self.count_hits = count_hits
+        self.hits = 0
+        self.misses = 0
+
+        table = _CountingTrigTable if count_hits else _TrigTable
+
+        self.radians = table(self, degree=False)
+        self.degrees = table(self, degree=True)
+
+    def sincos(self, angle: RealNumber, degree: bool = False) -> tuple:
+        '''
+        Returns (sin(angle), cos(angle)), converting the angle from degrees first if needed.
+        '''
+
+        return (self.degrees if degree else self.radians)[angle]
+
+    def preload(self, angles: list, degree: bool = False) -> None:
+        '''
+        Fills the cache with a known set of angles (e.g. the steps of a scan line),
+        so that not even the first lookup has to do the trigonometry.
+        Preloading doesn't count as hits or misses, and stops once the cache is full.
+        '''
+
+        table = self.degrees if degree else self.radians
+
+        for angle in angles:
+
+            if len(self) >= self.maxsize:
+
+                break
+
+            if angle not in table:
+
+                dict.__setitem__(table, angle, sincos(angle, degree))
+
+    def clear(self) -> None:
+
+        self.radians.clear()
+        self.degrees.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+
+        return len(self.radians) + len(self.degrees)
+
+    def info(self) -> dict:
+        '''
+        Hit / miss statistics, in the spirit of functools.lru_cache's cache_info.
+        hits is None unless the cache counts them.
+        '''
+
+        hits = self.hits if self.count_hits else None
+
+        return {'hits': hits, 'misses': self.misses, 'size': len(self), 'maxsize': self.maxsize}
+
+
+trig_cache = TrigCache()
+
+
 if __name__ == '__main__':
 
     a, b, c = (1, 1, 4)